@@ -48,6 +48,9 @@ NEEDS_TMP_KEY = [v for k,v in TOPICS.items() if k in(
 CODE_RENAMED = 10
 CODE_NO_SUCH_FROM_KEY = 11
 
+# How often, in seconds, subscribers waiting for messages check whether they should stop
+LISTEN_TIMEOUT = 1
+
 # ################################################################################################################################
 
 if 0:
@@ -87,6 +90,7 @@ class BrokerClientAPI(object):
 def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
 
     # Imported here so it's guaranteed to be monkey-patched using gevent.monkey.patch_all by whoever called us
+    from threading import Event
     from zato.common.py23_ import start_new_thread
 
     class _ClientThread(object):
@@ -100,6 +104,9 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
             self.keep_running = ZATO_NONE
             self.connect_sleep_time = 1
 
+            # Set when the client is closed so that the subscriber stops listening without waiting for an error from Redis
+            self.shutdown = Event()
+
         def set_up_pub_sub_client(self):
             try:
                 self.kvdb = self.kvdb.copy()
@@ -113,7 +120,8 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
 
         def run(self):
 
-            # We're in a new thread and we can initialize the KVDB connection now.
+            # Initialize the KVDB connection now - the subscriber runs this in its own background thread
+            # whereas the publisher calls it inline, from the thread that starts the broker client.
             self.kvdb.init()
 
             if self.pubsub == 'sub':
@@ -122,9 +130,10 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
                 self.keep_running = True
 
                 try:
-                    while self.keep_running:
+                    while not self.shutdown.is_set():
                         try:
-                            for msg in self.client.listen():
+                            msg = self.client.get_message(timeout=LISTEN_TIMEOUT)
+                            if msg:
                                 try:
                                     msg = Bunch(msg)
                                     msg.channel = msg.channel
@@ -139,6 +148,7 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
                                 self.set_up_pub_sub_client()
                 except KeyboardInterrupt:
                     self.keep_running = False
+                    self.shutdown.set()
 
             else:
                 self.client = self.kvdb
@@ -151,10 +161,11 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
 
         def close(self):
             self.keep_running = False
+            self.shutdown.set()
             self.client.close()
 
     class _BrokerClient(object):
-        """ Zato broker client. Starts two background threads, one for publishing and one for receiving of the messages.
+        """ Zato broker client. Publishes messages directly and starts a background thread for receiving of the messages.
 
         There may be 3 types of messages sent out:
 
@@ -190,8 +201,10 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
             self.pub_client = _ClientThread(self.kvdb.copy(), 'pub', self.name)
             self.sub_client = _ClientThread(self.kvdb.copy(), 'sub', self.name, self.topic_callbacks, self.on_message)
 
-            start_new_thread(self.pub_client.run, ())
-            start_new_thread(self.sub_client.run, ())
+            # The publishing client has no loop of its own - it only needs a KVDB connection,
+            # which means that it can be set up right here and only the subscriber needs a background thread.
+            self.pub_client.run()
+            start_new_thread(self.sub_client.run, (), daemon=True)
 
             for client in(self.pub_client, self.sub_client):
                 while client.keep_running == ZATO_NONE:
@@ -270,6 +283,7 @@ def BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs):
         def close(self):
             for client in(self.pub_client, self.sub_client):
                 client.keep_running = False
+                client.shutdown.set()
                 client.kvdb.close()
 
     client = _BrokerClient(kvdb, client_type, topic_callbacks, _initial_lua_programs)
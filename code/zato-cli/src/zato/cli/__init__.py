@@ -372,6 +372,9 @@ command_imports = (
     ('wait', 'zato.cli.wait.Wait'),
 )
 
+# The same as above, for direct look-ups by command name
+command_imports_dict = dict(command_imports)
+
 # ################################################################################################################################
 
 def run_command(args):
@@ -379,23 +382,18 @@ def run_command(args):
     # Zato
     from zato.common.util.import_ import import_string
 
-    # This may be needed in two places.
-    sorted_command_imports = sorted(command_imports)
-
-    # Iterate over all the commands that we know ..
-    for command_name, class_dotted_name in sorted_command_imports:
+    # Try to match the command given with our configuration ..
+    class_dotted_name = command_imports_dict.get(args.command)
 
-        # Try to match the command given with our configuration ..
-        if command_name == args.command:
-            class_ = import_string(class_dotted_name)
-            instance = class_(args)
+    # .. if there is no match, it means that configuration from zato_command.py does not match ours ..
+    if class_dotted_name is None:
+        raise Exception('Could not find `{}` among `{}`'.format(args.command, sorted(command_imports_dict)))
 
-            # .. we found a match so we can run the command.
-            return instance.run(args)
+    # .. we found a match so we can run the command.
+    class_ = import_string(class_dotted_name)
+    instance = class_(args)
 
-    # .. if we are here, it means that configuration from zato_command.py does not much our.
-    else:
-        raise Exception('Could not find `{}` among `{}`'.format(args.command, [elem[0] for elem in sorted_command_imports]))
+    return instance.run(args)
 
 # ################################################################################################################################
 
@@ -74,6 +74,27 @@ class CommandStore(object):
 
     add_start_server_parser = load_start_parser
 
+# ################################################################################################################################
+
+    def load_stop_parser(self, parser=None, base_parser=None, subs=None, formatter_class=None):
+
+        # Zato
+        from zato.cli import stop as stop_mod
+
+        if not parser:
+            parser, base_parser, subs, formatter_class = self.build_core_parser()
+
+        #
+        # stop
+        #
+        stop = subs.add_parser('stop', description=stop_mod.Stop.__doc__, parents=[base_parser])
+        stop.add_argument('path', help='Path to the Zato component to be stopped')
+        stop.set_defaults(command='stop')
+
+        return parser
+
+    add_stop_parser = load_stop_parser
+
 # ################################################################################################################################
 
     def load_version_parser(self):
@@ -121,7 +142,6 @@ class CommandStore(object):
              quickstart          as quickstart_mod,          \
              service             as service_mod,             \
              sso                 as sso_mod,                 \
-             stop                as stop_mod,                \
              wait                as wait_mod,                \
              web_admin_auth      as web_admin_auth_mod
 
@@ -497,9 +517,7 @@ class CommandStore(object):
         #
         # stop
         #
-        stop = subs.add_parser('stop', description=stop_mod.Stop.__doc__, parents=[base_parser])
-        stop.add_argument('path', help='Path to the Zato component to be stopped')
-        stop.set_defaults(command='stop')
+        self.add_stop_parser(parser, base_parser, subs, formatter_class)
 
         #
         # update
@@ -549,6 +567,10 @@ def main():
     elif has_args and sys.argv[1] == 'start':
         parser = command_store.load_start_parser()
 
+    # .. zato stop ...
+    elif has_args and sys.argv[1] == 'stop':
+        parser = command_store.load_stop_parser()
+
     # All the other commands
     else:
         parser = command_store.load_full_parser()
@@ -10,7 +10,6 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 from collections import OrderedDict
-from io import StringIO
 from numbers import Number
 from sys import maxsize
 
@@ -204,6 +203,24 @@ class ZMQ:
         SERVICE_SOURCE_NAME.MDP01: MDP01_HUMAN,
     })
 
+    class DEFAULT:
+
+        # How many messages a socket may queue up, in each direction, before it starts to block or drop them
+        SNDHWM = 1000
+        RCVHWM = 1000
+
+        # How long, in milliseconds, to wait for pending outgoing messages when a socket is being closed
+        LINGER = 50
+
+        # Kernel-level send buffer, in bytes, for outgoing connections
+        SNDBUF = 1 << 20
+
+        # The shared context uses half of all CPUs for its I/O threads, but no more than that many
+        MAX_IO_THREADS = 4
+
+        # How many sockets the shared context may hold
+        MAX_SOCKETS = 65536
+
 # ################################################################################################################################
 # ################################################################################################################################
 
@@ -1614,6 +1631,22 @@ class StatsElem:
     temp_mean - just like temp_rate but for mean response times
     temp_mean_count - how many periods containing a mean rate there were
     """
+    __slots__ = 'service_name', 'usage', 'mean', 'rate', 'time', 'usage_trend', 'usage_trend_int', 'mean_trend', \
+        'mean_trend_int', 'min_resp_time', 'max_resp_time', 'all_services_usage', 'all_services_time', 'mean_all_services', \
+        'usage_perc_all_services', 'time_perc_all_services', 'expected_time_elems', 'temp_rate', 'temp_mean', 'temp_mean_count'
+
+    # Public attributes, sorted by name. Note that usage_trend and mean_trend are set only if trends were requested,
+    # which is why they may be missing in a given instance.
+    _attrs = ('all_services_time', 'all_services_usage', 'expected_time_elems', 'max_resp_time', 'mean', 'mean_all_services',
+        'mean_trend', 'mean_trend_int', 'min_resp_time', 'rate', 'service_name', 'time', 'time_perc_all_services', 'usage',
+        'usage_perc_all_services', 'usage_trend', 'usage_trend_int')
+
+    # Attributes that to_dict does not return by default
+    _to_dict_ignore = ('expected_time_elems', 'mean_trend_int', 'usage_trend_int')
+
+    # Attributes that from_json and from_xml can set - any other keys on input are ignored
+    _settable = frozenset(__slots__)
+
     def __init__(self, service_name=None, mean=None):
         self.service_name = service_name
         self.usage = 0
@@ -1634,46 +1667,38 @@ class StatsElem:
         self.temp_mean = 0
         self.temp_mean_count = 0
 
-    def get_attrs(self, ignore=[]):
-        for attr in dir(self):
-            if attr.startswith('__') or attr.startswith('temp_') or callable(getattr(self, attr)) or attr in ignore:
-                continue
-            yield attr
+    def get_attrs(self, ignore=()):
+        return (attr for attr in self._attrs if attr not in ignore and hasattr(self, attr))
 
     def to_dict(self, ignore=None):
-        if not ignore:
-            ignore = ['expected_time_elems', 'mean_trend_int', 'usage_trend_int']
-        return {attr: getattr(self, attr) for attr in self.get_attrs(ignore)}
+        return {attr: getattr(self, attr) for attr in self.get_attrs(ignore or self._to_dict_ignore)}
 
     @staticmethod
     def from_json(item):
         stats_elem = StatsElem()
+        settable = stats_elem._settable
+
         for k, v in item.items():
-            setattr(stats_elem, k, v)
+            if k in settable:
+                setattr(stats_elem, k, v)
 
         return stats_elem
 
     @staticmethod
     def from_xml(item):
         stats_elem = StatsElem()
+        settable = stats_elem._settable
+
         for child in item.getchildren():
-            setattr(stats_elem, child.xpath('local-name()'), child.pyval)
+            name = child.xpath('local-name()')
+            if name in settable:
+                setattr(stats_elem, name, child.pyval)
 
         return stats_elem
 
     def __repr__(self):
-        buff = StringIO()
-        buff.write('<{} at {} '.format(self.__class__.__name__, hex(id(self))))
-
-        attrs = ('{}=[{}]'.format(attr, getattr(self, attr)) for attr in self.get_attrs())
-        buff.write(', '.join(attrs))
-
-        buff.write('>')
-
-        value = buff.getvalue()
-        buff.close()
-
-        return value
+        attrs = ', '.join(['%s=[%s]' % (attr, getattr(self, attr)) for attr in self.get_attrs()])
+        return '<%s at %s %s>' % (self.__class__.__name__, hex(id(self)), attrs)
 
     def __iadd__(self, other):
         self.max_resp_time = max(self.max_resp_time, other.max_resp_time)
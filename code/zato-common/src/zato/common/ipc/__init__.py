@@ -11,17 +11,48 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 # stdlib
 import os
 from datetime import datetime
+from multiprocessing import cpu_count
 from tempfile import gettempdir
+from threading import RLock
 
 # ZeroMQ
 import zmq.green as zmq
 
 # Zato
-from zato.common.api import DATA_FORMAT, NO_DEFAULT_VALUE
+from zato.common.api import DATA_FORMAT, NO_DEFAULT_VALUE, ZMQ
 from zato.common.util.api import get_logger_for_class, make_repr, new_cid, spawn_greenlet
 
 # ################################################################################################################################
 
+# A ZeroMQ context shared by all IPC endpoints and ZeroMQ connections of the current process, along with the PID
+# it was created in, because contexts must not be carried over to processes forked off the one that created them.
+_context = None
+_context_pid = None
+_context_lock = RLock()
+
+def get_context():
+    """ Returns a ZeroMQ context shared by all IPC endpoints and ZeroMQ connections in the current process,
+    creating it first if needed.
+    """
+    global _context, _context_pid
+
+    with _context_lock:
+
+        pid = os.getpid()
+
+        if _context_pid != pid:
+
+            # Half of all CPUs, within limits, are given to I/O threads so that a single one does not become a bottleneck
+            io_threads = min(ZMQ.DEFAULT.MAX_IO_THREADS, max(1, cpu_count() // 2))
+
+            _context = zmq.Context(io_threads=io_threads)
+            _context.set(zmq.MAX_SOCKETS, ZMQ.DEFAULT.MAX_SOCKETS)
+            _context_pid = pid
+
+    return _context
+
+# ################################################################################################################################
+
 class Request(object):
     def __init__(self, publisher_tag, publisher_pid, payload='', request_id=None):
         self.publisher_tag = publisher_tag
@@ -58,7 +89,7 @@ class IPCBase(object):
     def __init__(self, name, pid):
         self.name = name
         self.pid = pid
-        self.ctx = zmq.Context()
+        self.ctx = get_context()
         spawn_greenlet(self.set_up_sockets)
         self.keep_running = True
         self.logger = get_logger_for_class(self.__class__)
@@ -100,8 +131,8 @@ class IPCEndpoint(IPCBase):
         self.logger.info('Established %s/%s to %s (self.pid: %s)', self.socket_type, self.socket_method, self.address, self.pid)
 
     def close(self):
+        # Note that the context is not terminated because other endpoints may still be using it
         self.keep_running = False
         self.socket.close()
-        self.ctx.term()
 
 # ################################################################################################################################
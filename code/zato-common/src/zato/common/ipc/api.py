@@ -98,8 +98,11 @@ class IPCAPI(object):
             # We can tolerate it because it happens only the very first time our PID invokes target_pid
             sleep(0.1)
 
-            # We can now store it for later use
-            self.pid_publishers[target_pid] = publisher
+            # We can now store it for later use - unless another greenlet did the same while we were sleeping,
+            # in which case that other publisher is used and ours is closed so as not to keep two sockets to one PID.
+            existing = self.pid_publishers.setdefault(target_pid, publisher)
+            if existing is not publisher:
+                publisher.close()
 
         # At this point we are sure we have a publisher for target PID
         return self.pid_publishers[target_pid]
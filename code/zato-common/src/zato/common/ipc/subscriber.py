@@ -10,13 +10,17 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 from errno import ENOTSOCK
-from traceback import format_exc
+from operator import attrgetter
 
 # ZeroMQ
 import zmq.green as zmq
 
+# Python 2/3 compatibility
+from future.utils import PY2
+
 # Zato
 from zato.common.ipc import IPCEndpoint, Request
+from zato.common.py23_ import pickle_loads
 
 # This is needed so that unpickling of requests works
 Request = Request
@@ -36,14 +40,23 @@ class Subscriber(IPCEndpoint):
     def serve_forever(self):
         self.socket.setsockopt(zmq.SUBSCRIBE, b'')
 
+        # Micro-optimizations to make things faster
+        _recv = self.socket.recv
+        _loads = pickle_loads
+        _on_message_callback = self.on_message_callback
+
+        # Under Python 3, messages are unpickled straight from the buffer of a frame that libzmq owns,
+        # which saves us a copy per message. Python 2's cPickle accepts str objects only.
+        _get_data = attrgetter('bytes' if PY2 else 'buffer')
+
         while self.keep_running:
             try:
-                self.on_message_callback(self.socket.recv_pyobj())
+                _on_message_callback(_loads(_get_data(_recv(copy=False))))
             except zmq.ZMQError as e:
                 if e.errno == ENOTSOCK:
                     self.logger.debug('Stopping IPC socket `%s` (ENOTSOCK)', self.name)
                     self.keep_running = False
             except Exception:
-                self.logger.warn('Error in IPC subscriber, e:`%s`', format_exc())
+                self.logger.warn('Error in IPC subscriber', exc_info=True)
 
 # ################################################################################################################################
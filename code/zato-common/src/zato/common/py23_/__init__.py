@@ -35,5 +35,7 @@ izip = izip
 pickle_dumps = pickle_dumps
 pickle_loads = pickle_loads
 
-def start_new_thread(target, args):
-    return Thread(target=target, args=args).start()
+def start_new_thread(target, args, daemon=False):
+    thread = Thread(target=target, args=args)
+    thread.daemon = daemon
+    return thread.start()
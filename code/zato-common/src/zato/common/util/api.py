@@ -40,7 +40,6 @@ from os import getuid
 from os.path import abspath, isabs, join
 from pprint import pprint as _pprint, PrettyPrinter
 from pwd import getpwuid
-from string import Template
 from subprocess import Popen, PIPE
 from tempfile import NamedTemporaryFile
 from threading import current_thread
@@ -125,7 +124,6 @@ random.seed()
 logger = logging.getLogger(__name__)
 logging.addLevelName(TRACE1, "TRACE1")
 
-_repr_template = Template('<$class_name at $mem_loc$attrs>')
 _uncamelify_re = re.compile(r'((?<=[a-z])[A-Z]|(?<!\A)[A-Z](?=[a-z]))')
 
 _epoch = datetime.utcfromtimestamp(0) # Start of UNIX epoch
@@ -260,18 +258,14 @@ def make_repr(_object, ignore_double_underscore=True, to_avoid_list='repr_to_avo
     """ Makes a nice string representation of an object, suitable for logging purposes.
     """
     attrs = object_attrs(_object, ignore_double_underscore, to_avoid_list, sort)
-    buff = StringIO()
+    out = []
 
     for attr in attrs:
         attr_obj = getattr(_object, attr)
         if not callable(attr_obj):
-            buff.write('; %s:%r' % (attr, attr_obj))
+            out.append('; %s:%r' % (attr, attr_obj))
 
-    out = _repr_template.safe_substitute(
-        class_name=_object.__class__.__name__, mem_loc=hex(id(_object)), attrs=buff.getvalue())
-    buff.close()
-
-    return out
+    return '<%s at %s%s>' % (_object.__class__.__name__, hex(id(_object)), ''.join(out))
 
 # ################################################################################################################################
 
@@ -457,7 +451,8 @@ def payload_from_request(cid, request, data_format, transport, channel_item=None
                 return ''
             if isinstance(request, basestring) and data_format == _data_format_json:
                 try:
-                    request = request.decode('utf8') if isinstance(request, bytes) else request
+                    # Bytes are given to the parser as they are, without decoding the whole request to unicode first,
+                    # which would only make the parser encode it back to UTF-8 internally.
                     payload = loads(request)
                 except ValueError:
                     logger.warn('Could not parse request as JSON:`%s`, e:`%s`', request, format_exc())
@@ -11,6 +11,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 # stdlib
 from logging import getLogger
 from base64 import b64decode, b64encode
+from hmac import compare_digest
 
 # Python 2/3 compatibility
 from past.builtins import unicode
@@ -36,6 +37,20 @@ def parse_basic_auth(auth, prefix='Basic '):
 
     return auth.split(':', 1)
 
+# ################################################################################################################################
+
+def secrets_match(given, expected):
+    """ Compares two credentials, e.g. passwords or API keys, in time that does not depend on how many of their leading
+    characters are the same. Returns False if there is no expected value at all.
+    """
+    if expected is None:
+        return False
+
+    given = given if isinstance(given, bytes) else given.encode('utf8')
+    expected = expected if isinstance(expected, bytes) else expected.encode('utf8')
+
+    return compare_digest(given, expected)
+
 # ################################################################################################################################
 # ################################################################################################################################
 
@@ -161,7 +176,11 @@ def _on_basic_auth(auth, expected_username, expected_password):
     auth = auth if isinstance(auth, unicode) else auth.decode('utf8')
     username, password = auth.split(':', 1)
 
-    if username == expected_username and password == expected_password:
+    # Both need to be always checked so as not to reveal which one was invalid through response times
+    is_username_valid = secrets_match(username, expected_username)
+    is_password_valid = secrets_match(password, expected_password)
+
+    if is_username_valid and is_password_valid:
         return True
     else:
         return AUTH_BASIC_USERNAME_OR_PASSWORD_MISMATCH
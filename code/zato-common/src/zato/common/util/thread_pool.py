@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright (C) 2019, Zato Source s.r.o. https://zato.io
+
+Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+# stdlib
+from collections import deque
+from itertools import count
+from logging import getLogger
+from multiprocessing import cpu_count
+from threading import Event, Lock, Thread
+
+# ################################################################################################################################
+
+logger = getLogger(__name__)
+
+# ################################################################################################################################
+
+class ThreadPool(object):
+    """ A fixed-size pool of threads, each with its own queue of tasks. Tasks are submitted to queues in a round-robin manner,
+    or by key, and threads that run out of their own tasks steal ones from the other threads' queues. Only idle threads
+    are woken up when new tasks arrive, there is no single queue all the threads would contend for.
+    """
+    def __init__(self, name, size=None):
+        # type: (str, int)
+        self.name = name
+        self.size = size or cpu_count()
+        self.keep_running = True
+
+        # One queue of tasks and one wake-up event per thread
+        self.queues = [deque() for _ in range(self.size)]
+        self.events = [Event() for _ in range(self.size)]
+
+        # Indexes of threads that are currently waiting for tasks, along with a lock guarding the moment
+        # a thread decides to go to sleep so that it is never listed as idle while it is running a task.
+        self.idle = deque()
+        self.idle_lock = Lock()
+
+        # Used to select queues that new tasks are submitted to
+        self._counter = count()
+
+        self.threads = []
+
+# ################################################################################################################################
+
+    def start(self):
+        for idx in range(self.size):
+            thread = Thread(target=self._run, args=(idx,), name='{}-{}'.format(self.name, idx))
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+# ################################################################################################################################
+
+    def stop(self):
+        self.keep_running = False
+        for event in self.events:
+            event.set()
+
+# ################################################################################################################################
+
+    def submit(self, func, *args):
+        """ Schedules func to be called with args by one of the threads.
+        """
+        self._submit(next(self._counter) % self.size, func, args)
+
+# ################################################################################################################################
+
+    def submit_to(self, key, func, *args):
+        """ Like submit but tasks with the same key, e.g. a connection ID, are always added to the same thread's queue,
+        which means that unrelated producers do not share queues. Other threads may still steal such tasks if they are idle.
+        """
+        self._submit(hash(key) % self.size, func, args)
+
+# ################################################################################################################################
+
+    def _submit(self, idx, func, args):
+        self.queues[idx].append((func, args))
+
+        # Wake up one of the idle threads, if there are any - if there are none,
+        # the task will be picked up by the first thread that completes its current one.
+        with self.idle_lock:
+            try:
+                idx = self.idle.pop()
+            except IndexError:
+                return
+
+        self.events[idx].set()
+
+# ################################################################################################################################
+
+    def _get_task(self, idx):
+        """ Returns the next task from the thread's own queue or, if that one is empty, steals one from another thread's queue.
+        """
+        try:
+            return self.queues[idx].popleft()
+        except IndexError:
+            for offset in range(1, self.size):
+                try:
+                    return self.queues[(idx + offset) % self.size].pop()
+                except IndexError:
+                    continue
+
+# ################################################################################################################################
+
+    def _get_task_or_idle(self, idx):
+        """ Returns the next task for the thread or, if there are none, marks the thread as idle and returns None.
+        Checking the queues and marking the thread as idle happen under one lock, which means that a task submitted
+        in between is never missed and that a thread which found a task is never left in the idle list.
+        """
+        with self.idle_lock:
+            task = self._get_task(idx)
+            if task is None:
+                self.events[idx].clear()
+                self.idle.append(idx)
+            return task
+
+# ################################################################################################################################
+
+    def _run(self, idx):
+        event = self.events[idx]
+
+        while self.keep_running:
+
+            task = self._get_task(idx) or self._get_task_or_idle(idx)
+
+            if task is None:
+                event.wait()
+                continue
+
+            func, args = task
+
+            try:
+                func(*args)
+            except Exception:
+                logger.warn('Exception in thread pool `%s` task `%s`', self.name, func, exc_info=True)
+
+# ################################################################################################################################
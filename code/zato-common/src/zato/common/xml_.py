@@ -10,7 +10,6 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 from string import Template
-from traceback import format_exc
 
 # lxml
 from lxml import etree
@@ -68,8 +67,9 @@ wsu_username_created_xpath = etree.XPath(wsu_username_created_path, namespaces=c
 wsu_expires_path = '/soapenv:Envelope/soapenv:Header/wsse:Security/wsu:Timestamp/wsu:Expires'
 wsu_expires_xpath = etree.XPath(wsu_expires_path, namespaces=common_namespaces)
 
-wsse_username_objectify = '{}Security'.format(wsse_namespace)
-wsse_username_token_objectify = '{}UsernameToken'.format(wsse_namespace)
+# Clark-notation names, built once here so they can be compared against element tags as-is
+wsse_username_objectify = '{{{}}}Security'.format(wsse_namespace)
+wsse_username_token_objectify = '{{{}}}UsernameToken'.format(wsse_namespace)
 
 zato_data_path = soap_data_path = '/soapenv:Envelope/soapenv:Body/*[1]'
 zato_data_xpath = soap_data_xpath = etree.XPath(zato_data_path, namespaces=common_namespaces)
@@ -86,7 +86,24 @@ zato_details_xpath = etree.XPath(zato_details_path, namespaces=common_namespaces
 # ################################################################################################################################
 # ################################################################################################################################
 
+def _compile_path(clark):
+    """ Returns an ObjectPath for the Clark-notation path given on input or None if the path is invalid,
+    in which case get_from will report it as though it was a path that could not be found.
+    """
+    try:
+        return _ObjectPath(clark)
+    except ValueError:
+        return None
+
+# ################################################################################################################################
+# ################################################################################################################################
+
 class path(object):
+    __slots__ = 'path', 'ns', 'raise_on_not_found', 'text_only', 'children_only', 'children_only_idx', '_clark', '_objpath'
+
+    # All the attributes that make up the state of a path - _objpath is not one of them because it cannot be pickled
+    _state_attrs = tuple(name for name in __slots__ if name != '_objpath')
+
     def __init__(self, path, raise_on_not_found=False, ns='', text_only=False):
         self.path = path
         self.ns = ns
@@ -95,21 +112,34 @@ class path(object):
         self.children_only = False
         self.children_only_idx = None
 
+        # Paths do not change so they can be compiled once, here, rather than each time get_from is called
+        self._clark = '{{{}}}{}'.format(ns, path) if ns else path
+        self._objpath = _compile_path(self._clark)
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self._state_attrs}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        # ObjectPath instances cannot be pickled or copied so they are compiled anew each time a path is unpickled or copied
+        self._objpath = _compile_path(self._clark)
+
     def get_from(self, elem):
-        if self.ns:
-            _path = '{{{}}}{}'.format(self.ns, self.path)
-        else:
-            _path = self.path
         try:
             if self.children_only:
                 elem = elem.getchildren()[self.children_only_idx]
-            value = _ObjectPath(_path)(elem)
+            objpath = self._objpath if self._objpath is not None else _ObjectPath(self._clark)
+            value = objpath(elem)
             if self.text_only:
                 return value.text
             return value
-        except(ValueError, AttributeError):
+        except(ValueError, AttributeError) as e:
             if self.raise_on_not_found:
-                raise ParsingException(None, format_exc())
+
+                # No need to format the whole traceback here - the original exception is still available as __context__
+                raise ParsingException(None, 'Could not get `{}`, e:`{}`'.format(self._clark, e))
             else:
                 return None
 
@@ -117,6 +147,8 @@ class path(object):
 # ################################################################################################################################
 
 class zato_path(path):
+    __slots__ = ()
+
     def __init__(self, path, raise_on_not_found=False, text_only=False):
         super(zato_path, self).__init__(path, raise_on_not_found, zato_namespace, text_only)
         self.children_only = True
@@ -11,11 +11,15 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 # stdlib
 from unittest import TestCase
 
+# lxml
+from lxml import objectify
+
 # Nose
 from nose.tools import eq_
 
 # Zato
-from zato.common.api import soapenv11_namespace, soapenv12_namespace, StatsElem
+from zato.common.api import StatsElem
+from zato.common.xml_ import soapenv11_namespace, soapenv12_namespace
 
 class StatsElemTestCase(TestCase):
     def test_from_json(self):
@@ -35,6 +39,37 @@ class StatsElemTestCase(TestCase):
             value = getattr(stats_elem, k)
             eq_(v, value)
 
+    def test_from_json_unknown_key(self):
+        stats_elem = StatsElem.from_json({'service_name': 'my.service', 'usage': 3, 'my_unknown_key': 123})
+
+        eq_(stats_elem.service_name, 'my.service')
+        eq_(stats_elem.usage, 3)
+        self.assertFalse(hasattr(stats_elem, 'my_unknown_key'))
+
+    def test_from_xml_unknown_key(self):
+        item = objectify.fromstring('<item><service_name>my.service</service_name><usage>3</usage>'
+            '<my_unknown_key>123</my_unknown_key></item>')
+
+        stats_elem = StatsElem.from_xml(item)
+
+        eq_(stats_elem.service_name, 'my.service')
+        eq_(stats_elem.usage, 3)
+        self.assertFalse(hasattr(stats_elem, 'my_unknown_key'))
+
+    def test_to_dict(self):
+        stats_elem = StatsElem('my.service', 12.61)
+        stats_elem.usage_trend = '0,1,0'
+
+        out = stats_elem.to_dict()
+
+        eq_(out['service_name'], 'my.service')
+        eq_(out['mean'], 12.61)
+        eq_(out['usage_trend'], '0,1,0')
+
+        # Trends not set are not returned, and neither are attributes ignored by default or temporary ones
+        for name in ('mean_trend', 'expected_time_elems', 'mean_trend_int', 'usage_trend_int', 'temp_rate'):
+            self.assertNotIn(name, out)
+
 class TestSOAPNamespace(TestCase):
     def test_soap_ns(self):
         self.assertEquals(soapenv11_namespace, 'http://schemas.xmlsoap.org/soap/envelope/')
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright (C) 2019, Zato Source s.r.o. https://zato.io
+
+Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+# stdlib
+from threading import Event, Lock
+from unittest import TestCase
+
+# Zato
+from zato.common.util.thread_pool import ThreadPool
+
+# ################################################################################################################################
+
+class ThreadPoolTestCase(TestCase):
+    def test_submit(self):
+
+        total = 100
+        results = []
+        lock = Lock()
+        done = Event()
+
+        def _task(value):
+            with lock:
+                results.append(value)
+                if len(results) == total:
+                    done.set()
+
+        pool = ThreadPool('test', 4)
+        pool.start()
+
+        try:
+            for idx in range(total):
+                pool.submit(_task, idx)
+
+            self.assertTrue(done.wait(5))
+            self.assertListEqual(sorted(results), list(range(total)))
+        finally:
+            pool.stop()
+
+    def test_thread_with_task_is_not_idle(self):
+
+        # Threads are not started so that the moment a thread decides whether to go to sleep can be driven directly
+        pool = ThreadPool('test', 2)
+
+        task = (len, ((),))
+        pool.queues[0].append(task)
+
+        # Thread 0 finds a task so it must not be listed as idle whereas thread 1 has nothing to do so it becomes idle
+        self.assertIs(pool._get_task_or_idle(0), task)
+        self.assertIsNone(pool._get_task_or_idle(1))
+        self.assertListEqual(list(pool.idle), [1])
+
+        # A new task wakes up the thread that is really idle rather than the busy one
+        pool.submit(len, ())
+        self.assertTrue(pool.events[1].is_set())
+        self.assertFalse(pool.events[0].is_set())
+        self.assertListEqual(list(pool.idle), [])
+
+    def test_task_not_blocked_by_busy_thread(self):
+
+        release = Event()
+        done = Event()
+
+        pool = ThreadPool('test', 2)
+        pool.start()
+
+        try:
+            # Keep one of the threads busy and make sure the other one still runs new tasks
+            pool.submit(release.wait, 5)
+            pool.submit(done.set)
+
+            self.assertTrue(done.wait(5))
+        finally:
+            release.set()
+            pool.stop()
@@ -9,6 +9,7 @@ Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 # stdlib
+from copy import deepcopy
 from unittest import TestCase
 from uuid import uuid4
 
@@ -19,19 +20,20 @@ from bunch import Bunch
 from lxml import etree
 
 # Zato
-from zato.common.api import ParsingException, soap_body_xpath, zato_path
-from zato.common.util.api import util_api
-from zato.common.py23_ import maxint
+from zato.common.exception import ParsingException
+from zato.common.util import api as util_api
+from zato.common.py23_ import maxint, pickle_dumps, pickle_loads
 from zato.common.test.tls_material import ca_cert
+from zato.common.xml_ import soap_body_xpath, zato_path
 
 # ################################################################################################################################
 
 class ZatoPathTestCase(TestCase):
     def test_zato_path(self):
         xml = etree.fromstring("""<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
-         xmlns="https://zato.io/ns/20130518">
+         xmlns="https://zato.io/ns/v1">
       <soap:Body>
-            <zato_channel_amqp_edit_response xmlns="https://zato.io/ns/20130518">
+            <zato_channel_amqp_edit_response xmlns="https://zato.io/ns/v1">
                <zato_env>
                   <cid>K08984532360785332835581231451</cid>
                   <result>ZATO_OK</result>
@@ -55,6 +57,19 @@ class ZatoPathTestCase(TestCase):
         else:
             raise AssertionError('Expected an ParsingException with path:[{}]'.format(path))
 
+    def test_zato_path_copy_pickle(self):
+        xml = etree.fromstring("""<response xmlns="https://zato.io/ns/v1">
+               <zato_env><result>ZATO_OK</result></zato_env>
+               <item><name>crm.account</name></item>
+            </response>""")
+
+        original = zato_path('item.name', True, True)
+
+        for path in (deepcopy(original), pickle_loads(pickle_dumps(original))):
+            self.assertIsInstance(path, zato_path)
+            self.assertTrue(path.raise_on_not_found)
+            self.assertEqual(path.get_from(xml), 'crm.account')
+
 # ################################################################################################################################
 
 class UtilsTestCase(TestCase):
@@ -129,3 +144,5 @@ class TestAPIKeyUsername(TestCase):
         config = Bunch(username='x-aaa')
         util_api.update_apikey_username_to_channel(config)
         self.assertEquals(config.username, 'HTTP_X_AAA')
+
+# ################################################################################################################################
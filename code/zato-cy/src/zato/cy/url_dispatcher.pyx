@@ -142,7 +142,6 @@ cdef class CyURLData(object):
     def __init__(self, channel_data=None):
         self.channel_data = channel_data
         self.url_path_cache = {}
-        self.url_target_cache = {}
         self.has_trace1 = logger.isEnabledFor(TRACE1)
 
 # ################################################################################################################################
@@ -170,53 +169,42 @@ cdef class CyURLData(object):
         """ Attemps to match the combination of SOAPt Action and URL path against
         the list of HTTP channel targets.
         """
-        cdef bint needs_user, has_target_in_cache=True
+        cdef bint needs_user
         cdef Matcher matcher
         cdef dict item
         cdef object item_bunch
 
-        cdef unicode target = ''
-        target += soap_action
-        target += sep
-        target += http_method
-        target += sep
-        target += http_accept
-        target += sep
-        target += url_path
-
-        try:
-            self.url_target_cache[target]
-        except KeyError:
-            has_target_in_cache = False
-
-        # Return from cache if already seen
-        try:
-            ctx, channel_item = {}, self.url_path_cache[target]
-            return ctx, channel_item
-        except KeyError:
-            needs_user = not url_path.startswith('/zato')
+        # Built in one go rather than through a series of concatenations, each of which would allocate a new string
+        cdef unicode target = sep.join((soap_action, http_method, http_accept, url_path))
 
-            for item in self.channel_data:
+        # Return from cache if already seen - a single lookup, without raising KeyError for targets not cached
+        item_bunch = self.url_path_cache.get(target)
+        if item_bunch is not None:
+            return {}, item_bunch
 
-                matcher = item['match_target_compiled']
-                if needs_user and matcher.is_internal:
-                    continue
+        needs_user = not url_path.startswith('/zato')
+
+        for item in self.channel_data:
+
+            matcher = item['match_target_compiled']
+            if needs_user and matcher.is_internal:
+                continue
 
-                match = matcher.match(target)
+            match = matcher.match(target)
 
-                if match is not None:
-                    if self.has_trace1:
-                        _log_trace1(_trace1, 'Matched target:`%s` with:`%r`', target, item)
+            if match is not None:
+                if self.has_trace1:
+                    _log_trace1(_trace1, 'Matched target:`%s` with:`%r`', target, item)
 
-                    item_bunch = _bunchify(item)
+                item_bunch = _bunchify(item)
 
-                    # Cache that target but only if it's a static URL without dynamic variables
-                    if (not has_target_in_cache) and matcher.is_static:
-                        self.url_path_cache[target] = item_bunch
+                # Cache that target but only if it's a static URL without dynamic variables
+                if matcher.is_static:
+                    self.url_path_cache[target] = item_bunch
 
-                    return match, item_bunch
+                return match, item_bunch
 
-            return None, None
+        return None, None
 
 # ################################################################################################################################
 # ################################################################################################################################
@@ -10,9 +10,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 from datetime import datetime
-from http.client import INTERNAL_SERVER_ERROR, responses
+from http.client import INTERNAL_SERVER_ERROR, NO_CONTENT, NOT_MODIFIED, responses
 from logging import getLogger, INFO
-from traceback import format_exc
 
 # pytz
 from pytz import UTC
@@ -36,6 +35,11 @@ logger = getLogger(__name__)
 
 ACCESS_LOG_DT_FORMAT = '%d/%b/%Y:%H:%M:%S %z'
 
+_status_internal_server_error = '{} {}'.format(INTERNAL_SERVER_ERROR, responses[INTERNAL_SERVER_ERROR])
+
+# Prefixes of statuses of responses that must not have the Content-Length header
+_no_content_length_status = ('1', '{} '.format(NO_CONTENT), '{} '.format(NOT_MODIFIED))
+
 # ################################################################################################################################
 
 class HTTPHandler(object):
@@ -67,11 +71,8 @@ class HTTPHandler(object):
 
         # Any exception at this point must be a server-side error
         except Exception:
-            tb = format_exc()
-            wsgi_environ['zato.http.response.status'] = b'%s %s' % (bytes(INTERNAL_SERVER_ERROR), str(responses[INTERNAL_SERVER_ERROR]))
-            error_msg = b'`%s` Exception caught `%s`' % (cid, tb)
-            logger.error(error_msg)
-            payload = error_msg if self.return_tracebacks else self.default_error_message
+            wsgi_environ['zato.http.response.status'] = _status_internal_server_error
+            logger.error('`%s` Exception caught', cid, exc_info=True)
             raise
 
         channel_item = wsgi_environ.get('zato.channel_item')
@@ -84,11 +85,30 @@ class HTTPHandler(object):
             # 405 because this was an invalid HTTP method
             channel_name = '-'
 
-        start_response(wsgi_environ['zato.http.response.status'], iteritems(wsgi_environ['zato.http.response.headers']))
-
+        # The payload must be bytes before its length is taken - for unicode objects len() would return
+        # the number of characters rather than that of bytes sent to the client.
         if isinstance(payload, unicode):
             payload = payload.encode('utf-8')
 
+        status = wsgi_environ['zato.http.response.status']
+        response_headers = wsgi_environ['zato.http.response.headers']
+
+        # With Content-Length known upfront, the response is written as-is instead of using chunked transfer encoding.
+        # Responses to HEAD requests have no body so only the service knows what the length would have been,
+        # which is why whatever it set, if anything, is kept as-is.
+        if wsgi_environ['REQUEST_METHOD'] != 'HEAD':
+
+            # A service may have already set it itself, possibly using a different case,
+            # which is why any such header is replaced rather than added to.
+            for name in [name for name in response_headers if name.lower() == 'content-length']:
+                del response_headers[name]
+
+            # Responses with codes 1xx, 204 and 304 never have a body, and then no Content-Length either.
+            if not status.startswith(_no_content_length_status):
+                response_headers['Content-Length'] = str(len(payload))
+
+        start_response(status, iteritems(response_headers))
+
         if self.needs_access_log:
 
             # Either log all HTTP requests or make sure that current path
@@ -104,7 +124,7 @@ class HTTPHandler(object):
                     'method': wsgi_environ['REQUEST_METHOD'],
                     'path': wsgi_environ['PATH_INFO'],
                     'http_version': wsgi_environ['SERVER_PROTOCOL'],
-                    'status_code': wsgi_environ['zato.http.response.status'].split()[0],
+                    'status_code': status.split()[0],
                     'response_size': len(payload),
                     'user_agent': wsgi_environ.get('HTTP_USER_AGENT', '(None)'),
                 })
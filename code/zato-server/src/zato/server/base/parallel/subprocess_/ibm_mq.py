@@ -54,6 +54,14 @@ class IBMMQIPC(SubprocessIPC):
 
 # Public API methods
 
+# ################################################################################################################################
+
+    def get_extra_config(self):
+        return {
+            # New in 3.2 hence optional
+            'callback_pool_size': self.server.fs_server_config.misc.get('ibm_mq_callback_pool_size'),
+        }
+
 # ################################################################################################################################
 
     def start_ibm_mq_connector(self, *args, **kwargs):
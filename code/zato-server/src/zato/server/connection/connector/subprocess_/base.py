@@ -188,6 +188,9 @@ class BaseConnectionContainer(object):
         self.channel_id_to_def_id = {} # Ditto but for channels
         self.outconn_name_to_id = {}   # Maps outgoing connection names to their IDs
 
+        # Configuration sent by our parent process, set in self.set_config
+        self.startup_config = None
+
         self.set_config()
 
     def set_config(self):
@@ -198,6 +201,8 @@ class BaseConnectionContainer(object):
         config = loads(config)
         config = bunchify(config)
 
+        self.startup_config = config
+
         self.username = config.username
         self.password = config.password
         self.server_auth = (self.username, self.password)
@@ -231,6 +236,13 @@ class BaseConnectionContainer(object):
     def get_prereqs_not_ready_message(self):
         return '<default-not-set-prereqs-not-ready-message>'
 
+# ################################################################################################################################
+
+    def on_shutdown(self):
+        """ Invoked when the process is shutting down, after all connections have been closed.
+        Subclasses can override it to release resources of their own.
+        """
+
 # ################################################################################################################################
 
     def set_up_logging(self, config):
@@ -647,6 +659,7 @@ class BaseConnectionContainer(object):
                 server.shutdown()
                 for conn in self.connections.values():
                     conn.close()
+                self.on_shutdown()
             except Exception:
                 # Log exception if cleanup was not possible
                 self.logger.warn('Exception in shutdown procedure `%s`', format_exc())
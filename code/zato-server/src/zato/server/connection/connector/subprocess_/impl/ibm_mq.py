@@ -27,6 +27,7 @@ Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
 # stdlib
 import logging
 from logging import DEBUG
+from multiprocessing import cpu_count
 from http.client import BAD_REQUEST, FORBIDDEN, INTERNAL_SERVER_ERROR, NOT_ACCEPTABLE, OK, responses, SERVICE_UNAVAILABLE
 from time import sleep
 from traceback import format_exc
@@ -36,6 +37,7 @@ from zato.common.py23_ import start_new_thread
 
 # Zato
 from zato.common.json_internal import dumps
+from zato.common.util.thread_pool import ThreadPool
 from zato.server.connection.jms_wmq.jms import WebSphereMQException, NoMessageAvailableException
 from zato.server.connection.jms_wmq.jms.connection import WebSphereMQConnection
 from zato.server.connection.jms_wmq.jms.core import TextMessage
@@ -67,6 +69,10 @@ _rc_host_not_available = 2538  # pymqi.CMQC.MQRC_HOST_NOT_AVAILABLE
 # A list of reason codes upon which we will try to reconnect
 _rc_reconnect_list = [_rc_conn_broken, _rc_q_mgr_quiescing, _rc_host_not_available]
 
+# Message callbacks block on HTTP calls to the server so there are more threads than CPUs to invoke them with.
+# This is the default that can be changed through ibm_mq_callback_pool_size in server.conf's [misc] section.
+_callback_pool_size = cpu_count() * 4
+
 # ################################################################################################################################
 
 class _MessageCtx(object):
@@ -84,13 +90,14 @@ class _MessageCtx(object):
 class IBMMQChannel(object):
     """ A process to listen for messages from IBM MQ queue managers.
     """
-    def __init__(self, conn, channel_id, queue_name, service_name, data_format, on_message_callback, logger):
+    def __init__(self, conn, channel_id, queue_name, service_name, data_format, on_message_callback, callback_pool, logger):
         self.conn = conn
         self.id = channel_id
         self.queue_name = queue_name
         self.service_name = service_name
         self.data_format = data_format
         self.on_message_callback = on_message_callback
+        self.callback_pool = callback_pool
         self.keep_running = False
         self.logger = logger
         self.has_debug = self.logger.isEnabledFor(DEBUG)
@@ -131,8 +138,8 @@ class IBMMQChannel(object):
                         return
 
                     if msg:
-                        start_new_thread(_invoke_callback, (
-                            _MessageCtx(msg, self.id, self.queue_name, self.service_name, self.data_format),))
+                        self.callback_pool.submit_to(self.id, _invoke_callback,
+                            _MessageCtx(msg, self.id, self.queue_name, self.service_name, self.data_format))
 
                 except NoMessageAvailableException:
                     if self.has_debug:
@@ -212,6 +219,18 @@ class IBMMQConnectionContainer(BaseConnectionContainer):
         # Call our parent to initialize everything
         super().__init__()
 
+        # Invokes callbacks for messages received by all channels
+        callback_pool_size = int(self.startup_config.get('callback_pool_size') or _callback_pool_size)
+        self.callback_pool = ThreadPool('ibm-mq-callback', callback_pool_size)
+        self.callback_pool.start()
+
+        self.logger.info('IBM MQ callback pool size is %s', callback_pool_size)
+
+# ################################################################################################################################
+
+    def on_shutdown(self):
+        self.callback_pool.stop()
+
 # ################################################################################################################################
 
     def check_prereqs_ready(self):
@@ -375,7 +394,7 @@ class IBMMQConnectionContainer(BaseConnectionContainer):
 
     def _create_channel_impl(self, conn, msg):
         return IBMMQChannel(conn, msg.id, msg.queue.encode('utf8'), msg.service_name, msg.data_format,
-            self.on_mq_message_received, self.logger)
+            self.on_mq_message_received, self.callback_pool, self.logger)
 
 # ################################################################################################################################
 
@@ -80,6 +80,18 @@ class SubprocessIPC(object):
         self.server = server
         self.ipc_tcp_port = None
 
+# ################################################################################################################################
+
+    @property
+    def ipc_tcp_port(self):
+        return self._ipc_tcp_port
+
+    @ipc_tcp_port.setter
+    def ipc_tcp_port(self, value, _address_pattern=address_pattern):
+        # The address connectors are invoked through depends on the port only so it is built once here rather than per message
+        self._ipc_tcp_port = value
+        self.ipc_api_address = _address_pattern.format(value, 'api')
+
 # ################################################################################################################################
 
     def _check_enabled(self):
@@ -97,6 +109,13 @@ class SubprocessIPC(object):
         config = self.server.worker_store.basic_auth_get(self.auth_username)['config']
         return config.username, config.password
 
+# ################################################################################################################################
+
+    def get_extra_config(self):
+        """ Returns startup configuration specific to a given connector, if any, to be sent along with the common one.
+        """
+        return {}
+
 # ################################################################################################################################
 
     def start_connector(self, ipc_tcp_start_port, timeout=5):
@@ -114,7 +133,7 @@ class SubprocessIPC(object):
         username, password = self.get_credentials()
 
         # Employ IPC to exchange subprocess startup configuration
-        self.server.connector_config_ipc.set_config(self.ipc_config_name, dumps({
+        config = {
             'port': self.ipc_tcp_port,
             'username': username,
             'password': password,
@@ -125,7 +144,9 @@ class SubprocessIPC(object):
             'needs_pidfile': not self.server.has_fg,
             'pidfile_suffix': self.pidfile_suffix,
             'logging_conf_path': self.server.logging_conf_path
-        }))
+        }
+        config.update(self.get_extra_config())
+        self.server.connector_config_ipc.set_config(self.ipc_config_name, dumps(config))
 
         # Start connector in a sub-process
         start_python_process('{} connector'.format(self.connector_name), False, self.connector_module, '', extra_options={
@@ -199,12 +220,11 @@ class SubprocessIPC(object):
 
 # ################################################################################################################################
 
-    def invoke_connector(self, msg, raise_on_error=True, address_pattern=address_pattern):
+    def invoke_connector(self, msg, raise_on_error=True):
         if self.check_enabled:
             self._check_enabled()
 
-        address = address_pattern.format(self.ipc_tcp_port, 'api')
-        response = post(address, data=dumps(msg), auth=self.get_credentials()) # type: Response
+        response = post(self.ipc_api_address, data=dumps(msg), auth=self.get_credentials()) # type: Response
 
         if not response.ok:
             if raise_on_error:
@@ -213,7 +233,7 @@ class SubprocessIPC(object):
                 else:
                     raise Exception(response.text)
             else:
-                logger.warn('Error message from {} connector `{}`'.format(self.connector_name, response.text))
+                logger.warn('Error message from %s connector `%s`', self.connector_name, response.text)
         else:
             #if not response.text:
             #    raise ConnectorClosedException(None, '<empty-response>')
@@ -41,8 +41,7 @@ from zato.common.json_schema import DictError as JSONSchemaDictError, Validation
 from zato.common.rate_limiting.common import AddressNotAllowed, BaseException as RateLimitingException, RateLimitReached
 from zato.common.util.api import payload_from_request
 from zato.common.xml_ import zato_namespace
-from zato.server.connection.http_soap import BadRequest, ClientHTTPError, Forbidden, MethodNotAllowed, NotFound, \
-     TooManyRequests, Unauthorized
+from zato.server.connection.http_soap import ClientHTTPError, NotFound, Unauthorized
 from zato.server.service.internal import AdminService
 
 stack_format = None
@@ -83,6 +82,20 @@ _status_unauthorized = '{} {}'.format(UNAUTHORIZED, HTTP_RESPONSES[UNAUTHORIZED]
 _status_forbidden = '{} {}'.format(FORBIDDEN, HTTP_RESPONSES[FORBIDDEN])
 _status_too_many_requests = '{} {}'.format(TOO_MANY_REQUESTS, HTTP_RESPONSES[TOO_MANY_REQUESTS])
 
+# Statuses to return for client HTTP errors, by the code each exception carries - any other code maps to HTTP 500
+_client_http_error_status = {
+    UNAUTHORIZED: _status_unauthorized,
+    BAD_REQUEST: _status_bad_request,
+    NOT_FOUND: _status_not_found,
+    METHOD_NOT_ALLOWED: _status_method_not_allowed,
+    FORBIDDEN: _status_forbidden,
+    TOO_MANY_REQUESTS: _status_too_many_requests,
+}
+
+# Responses to rate limiting and IP whitelisting errors never change so they are built upfront
+_rate_limit_reached_response = 'Error {}'.format(_status_too_many_requests)
+_address_not_allowed_response = 'Error {}'.format(_status_forbidden)
+
 # ################################################################################################################################
 
 _data_format_hl7 = HL7.Const.Version.v2.id
@@ -103,6 +116,9 @@ for code, response in HTTP_RESPONSES.items():
 
 soap_doc = """<?xml version='1.0' encoding='UTF-8'?><soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" xmlns="https://zato.io/ns/20130518"><soap:Body>{body}</soap:Body></soap:Envelope>""" # noqa
 
+# The same envelope split into the parts before and after its body, so that responses can be wrapped using concatenation
+soap_doc_prefix, soap_doc_suffix = soap_doc.split('{body}')
+
 # ################################################################################################################################
 
 zato_message_soap = """<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" xmlns="https://zato.io/ns/20130518">
@@ -146,13 +162,23 @@ def client_json_error(cid, details):
 
 # ################################################################################################################################
 
-def client_soap_error(cid, faultstring):
-    return soap_error.format(**{'faultcode':'Client', 'cid':cid, 'faultstring':faultstring})
+# The two fault codes that we use are known upfront so the error envelopes for each are prepared once,
+# leaving only the CID and fault string to be filled in for each response.
+def _get_soap_error_template(faultcode):
+    return soap_error.replace('{faultcode}', faultcode).replace('{cid}', '%s').replace('{faultstring}', '%s')
+
+_client_soap_error = _get_soap_error_template('Client')
+_server_soap_error = _get_soap_error_template('Server')
+
+# ################################################################################################################################
+
+def client_soap_error(cid, faultstring, _template=_client_soap_error):
+    return _template % (cid, faultstring)
 
 # ################################################################################################################################
 
-def server_soap_error(cid, faultstring):
-    return soap_error.format(**{'faultcode':'Server', 'cid':cid, 'faultstring':faultstring})
+def server_soap_error(cid, faultstring, _template=_server_soap_error):
+    return _template % (cid, faultstring)
 
 # ################################################################################################################################
 
@@ -253,6 +279,10 @@ class RequestDispatcher(object):
         _jwt=_jwt, _sso_ext_auth=_sso_ext_auth, _data_format_hl7=_data_format_hl7, _channel=CHANNEL.HTTP_SOAP,
         _utcnow=datetime.utcnow):
 
+        # Bound once per request to reduce the number of attribute lookups below
+        url_data = self.url_data
+        server = self.server
+
         # Needed as one of the first steps
         http_method = wsgi_environ['REQUEST_METHOD']
         http_method = http_method if isinstance(http_method, unicode) else http_method.decode('utf8')
@@ -279,7 +309,7 @@ class RequestDispatcher(object):
         # This gives us the URL info and security data - but note that here
         # we still haven't validated credentials, only matched the URL.
         # Credentials are checked in a call to self.url_data.check_security
-        url_match, channel_item = self.url_data.match(path_info, soap_action, http_method, http_accept, bool(soap_action))
+        url_match, channel_item = url_data.match(path_info, soap_action, http_method, http_accept, bool(soap_action))
 
         if _has_debug and channel_item:
             logger.debug('url_match:`%r`, channel_item:`%r`', url_match, sorted(channel_item.items()))
@@ -309,31 +339,35 @@ class RequestDispatcher(object):
                 post_data = {}
 
                 match_target = channel_item['match_target']
-                sec = self.url_data.url_sec[match_target]
+                sec = url_data.url_sec[match_target]
+                sec_def = sec.sec_def
 
-                if sec.sec_def != ZATO_NONE or sec.sec_use_rbac is True:
+                if sec_def != ZATO_NONE or sec.sec_use_rbac is True:
 
-                    if sec.sec_def != ZATO_NONE:
+                    if sec_def != ZATO_NONE:
 
-                        if sec.sec_def.sec_type == SEC_DEF_TYPE.OAUTH:
+                        if sec_def.sec_type == SEC_DEF_TYPE.OAUTH:
                             post_data.update(QueryDict(payload, encoding='utf-8'))
 
                         # Eagerly parse the request but only if we expect XPath-based credentials. The request will be re-used
                         # in later steps, it won't be parsed twice or more.
-                        elif sec.sec_def.sec_type == SEC_DEF_TYPE.XPATH_SEC:
+                        elif sec_def.sec_type == SEC_DEF_TYPE.XPATH_SEC:
                             wsgi_environ['zato.request.payload'] = payload_from_request(
                                 cid, payload, channel_item.data_format, channel_item.transport)
 
                     # Will raise an exception on any security violation
-                    auth_result = self.url_data.check_security(
+                    auth_result = url_data.check_security(
                         sec, cid, channel_item, path_info, payload, wsgi_environ, post_data, worker_store)
 
+                    # RBAC-delegated checks replace sec.sec_def with the definition the client was authenticated with
+                    sec_def = sec.sec_def
+
                 # Check rate limiting now - this could not have been done earlier because we wanted
                 # for security checks to be made first. Otherwise, someone would be able to invoke
                 # our endpoint without credentials as many times as it is needed to exhaust the rate limit
                 # denying in this manner access to genuine users.
                 if channel_item.get('is_rate_limit_active'):
-                    self.server.rate_limiting.check_limit(
+                    server.rate_limiting.check_limit(
                         cid, _rate_limit_type_http, channel_item['name'], wsgi_environ['zato.http.remote_addr'])
 
                 # Store data received in audit log now - again, just like we rate limiting, we did not want to do it too soon.
@@ -348,7 +382,7 @@ class RequestDispatcher(object):
                     data_event.msg_id = cid
 
                     # .. and store it in the audit log.
-                    self.server.audit_log.store_data_received(data_event)
+                    server.audit_log.store_data_received(data_event)
 
                 # Security definition-based checks went fine but it is still possible
                 # that this sec_def is linked to an SSO user whose rate limits we need to check.
@@ -357,22 +391,22 @@ class RequestDispatcher(object):
                 if self._sso_api_user:
 
                     # Not all sec_def types may have associated SSO users
-                    if sec.sec_def != ZATO_NONE:
+                    if sec_def != ZATO_NONE:
 
-                        if sec.sec_def.sec_type in _sso_ext_auth:
+                        if sec_def.sec_type in _sso_ext_auth:
 
                             # JWT comes with external sessions whereas Basic Auth does not
-                            if sec.sec_def.sec_type == _jwt:
+                            if sec_def.sec_type == _jwt:
                                 ext_session_id = auth_result.raw_token
                             else:
                                 ext_session_id = None
 
                             # Try to log in the user to SSO by that account's external credentials.
-                            self.server.sso_tool.on_external_auth(
-                                sec.sec_def.sec_type, sec.sec_def.id, sec.sec_def.username, cid,
+                            server.sso_tool.on_external_auth(
+                                sec_def.sec_type, sec_def.id, sec_def.username, cid,
                                 wsgi_environ, ext_session_id)
                         else:
-                            raise Exception('Unexpected sec_type `{}`'.format(sec.sec_def.sec_type))
+                            raise Exception('Unexpected sec_type `{}`'.format(sec_def.sec_type))
 
                 # This is handy if someone invoked URLData's OAuth API manually
                 wsgi_environ['zato.oauth.post_data'] = post_data
@@ -381,8 +415,9 @@ class RequestDispatcher(object):
                 response = self.request_handler.handle(cid, url_match, channel_item, wsgi_environ,
                     payload, worker_store, self.simple_io_config, post_data, path_info, soap_action)
 
-                wsgi_environ['zato.http.response.headers']['Content-Type'] = response.content_type
-                wsgi_environ['zato.http.response.headers'].update(response.headers)
+                response_headers = wsgi_environ['zato.http.response.headers']
+                response_headers['Content-Type'] = response.content_type
+                response_headers.update(response.headers)
                 wsgi_environ['zato.http.response.status'] = _status_response[response.status_code]
 
                 if channel_item['content_encoding'] == 'gzip':
@@ -393,7 +428,7 @@ class RequestDispatcher(object):
                     response.payload = s.getvalue()
                     s.close()
 
-                    wsgi_environ['zato.http.response.headers']['Content-Encoding'] = 'gzip'
+                    response_headers['Content-Encoding'] = 'gzip'
 
                 # Store data sent in audit
                 if channel_item.get('is_audit_log_sent_active'):
@@ -408,41 +443,23 @@ class RequestDispatcher(object):
                     data_event.in_reply_to = cid
 
                     # .. and store it in the audit log.
-                    self.server.audit_log.store_data_sent(data_event)
+                    server.audit_log.store_data_sent(data_event)
 
                 # Finally, return payload to the client
                 return response.payload
 
             except Exception as e:
-                _format_exc = format_exc()
                 status = _status_internal_server_error
 
                 if isinstance(e, ClientHTTPError):
 
                     response = e.msg
                     status_code = e.status
-
-                    # TODO: Refactor this series of if/else's into a lookup dict.
+                    status = _client_http_error_status.get(status_code, status)
 
                     if isinstance(e, Unauthorized):
-                        status = _status_unauthorized
                         wsgi_environ['zato.http.response.headers']['WWW-Authenticate'] = e.challenge
 
-                    elif isinstance(e, BadRequest):
-                        status = _status_bad_request
-
-                    elif isinstance(e, NotFound):
-                        status = _status_not_found
-
-                    elif isinstance(e, MethodNotAllowed):
-                        status = _status_method_not_allowed
-
-                    elif isinstance(e, Forbidden):
-                        status = _status_forbidden
-
-                    elif isinstance(e, TooManyRequests):
-                        status = _status_too_many_requests
-
                 else:
 
                     # JSON Schema validation
@@ -462,25 +479,26 @@ class RequestDispatcher(object):
 
                     else:
                         status_code = INTERNAL_SERVER_ERROR
-                        response = _format_exc if self.return_tracebacks else self.default_error_message
-
-                _exc = _stack_format(e, style='color', show_vals='like_source', truncate_vals=5000,
-                    add_summary=True, source_lines=20) if _stack_format else _format_exc
+                        response = format_exc() if self.return_tracebacks else self.default_error_message
 
                 # TODO: This should be configurable. Some people may want such
                 # things to be on DEBUG whereas for others ERROR will make most sense
                 # in given circumstances.
-                logger.error(
-                    'Caught an exception, cid:`%s`, status_code:`%s`, `%s`', cid, status_code, _exc)
+                if _stack_format:
+                    logger.error('Caught an exception, cid:`%s`, status_code:`%s`, `%s`', cid, status_code,
+                        _stack_format(e, style='color', show_vals='like_source', truncate_vals=5000,
+                            add_summary=True, source_lines=20))
+                else:
+                    # The traceback is formatted by the logging handler, and only if the message is to be emitted at all
+                    logger.error('Caught an exception, cid:`%s`, status_code:`%s`', cid, status_code, exc_info=True)
 
                 try:
                     error_wrapper = get_client_error_wrapper(channel_item['transport'], channel_item['data_format'])
                 except KeyError:
                     # It's OK. Apparently it's neither 'soap' nor json'
                     if logger.isEnabledFor(TRACE1):
-                        msg = 'No client error wrapper for transport:`{}`, data_format:`{}`'.format(
+                        logger.log(TRACE1, 'No client error wrapper for transport:`%s`, data_format:`%s`',
                             channel_item.get('transport'), channel_item.get('data_format'))
-                        logger.log(TRACE1, msg)
                 else:
                     response = error_wrapper(cid, response)
 
@@ -509,14 +527,10 @@ class RequestDispatcher(object):
         # type: (unicode, RateLimitingException, dict, unicode, unicode) -> (unicode, int, unicode)
 
         if isinstance(e, RateLimitReached):
-            status_code = TOO_MANY_REQUESTS
-            status = _status_too_many_requests
+            return _rate_limit_reached_response, TOO_MANY_REQUESTS, _status_too_many_requests
 
         elif isinstance(e, AddressNotAllowed):
-            status_code = FORBIDDEN
-            status = _status_forbidden
-
-        return 'Error {}'.format(status), status_code, status
+            return _address_not_allowed_response, FORBIDDEN, _status_forbidden
 
 # ################################################################################################################################
 
@@ -756,7 +770,10 @@ class RequestHandler(object):
         if transport == _url_type_soap:
             if not isinstance(service_instance, _AdminService):
                 if self.use_soap_envelope:
-                    response.payload = soap_doc.format(body=response.payload)
+                    payload = response.payload
+                    if isinstance(payload, bytes):
+                        payload = payload.decode('utf8')
+                    response.payload = soap_doc_prefix + payload + soap_doc_suffix
 
 # ################################################################################################################################
 
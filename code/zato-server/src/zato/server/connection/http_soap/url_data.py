@@ -11,9 +11,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 # stdlib
 import logging
 from base64 import b64encode
+from collections import namedtuple
 from operator import itemgetter
 from threading import RLock
-from traceback import format_exc
 
 # Python 2/3 compatibility
 from future.utils import iteritems, iterkeys, itervalues
@@ -22,12 +22,13 @@ from six import PY2
 
 # Zato
 from zato.bunch import Bunch
-from zato.common.api import CHANNEL, CONNECTION, DATA_FORMAT, MISC, RATE_LIMIT, SEC_DEF_TYPE, URL_TYPE, ZATO_NONE
+from zato.common.api import CHANNEL, CONNECTION, DATA_FORMAT, MISC, RATE_LIMIT, SEC_DEF_TYPE, SEC_DEF_TYPE_NAME, URL_TYPE, \
+     ZATO_NONE
 from zato.common.vault_ import VAULT
 from zato.common.broker_message import code_to_name, SECURITY, VAULT as VAULT_BROKER_MSG
 from zato.common.dispatch import dispatcher
 from zato.common.util.api import parse_tls_channel_security_definition, update_apikey_username_to_channel
-from zato.common.util.auth import on_basic_auth, on_wsse_pwd, WSSE
+from zato.common.util.auth import on_basic_auth, on_wsse_pwd, secrets_match, WSSE
 from zato.common.util.url_dispatcher import get_match_target
 from zato.server.connection.http_soap import Forbidden, Unauthorized
 from zato.server.jwt import JWT
@@ -70,6 +71,13 @@ logger = logging.getLogger(__name__)
 
 _internal_url_path_indicator = '{}/zato/'.format(MISC.SEPARATOR)
 
+# Message sent to clients and logged when they cannot be authenticated
+_unauthorized_template = 'UNAUTHORIZED path_info:`%s`, cid:`%s`'
+
+# Security information of a client that RBAC delegates the check to - a tuple rather than a Bunch
+# because one is created for each client definition visited during each request.
+_DelegatedSecInfo = namedtuple('_DelegatedSecInfo', 'is_active transport sec_use_rbac sec_def')
+
 # ################################################################################################################################
 # ################################################################################################################################
 
@@ -116,6 +124,13 @@ class URLData(CyURLData, OAuthDataStore):
         self.sec_config_getter[SEC_DEF_TYPE.APIKEY] = self.apikey_get
         self.sec_config_getter[SEC_DEF_TYPE.JWT] = self.jwt_get
 
+        # Maps security definition types to methods that handle them, so that they do not need to be looked up for each request
+        self.sec_handler = {}
+        for sec_def_type in SEC_DEF_TYPE_NAME:
+            handler = getattr(self, '_handle_security_{}'.format(sec_def_type), None)
+            if handler:
+                self.sec_handler[sec_def_type] = handler
+
         self.json_pointer_store = json_pointer_store
         self.xpath_store = xpath_store
 
@@ -245,22 +260,23 @@ class URLData(CyURLData, OAuthDataStore):
     def _handle_security_apikey(self, cid, sec_def, path_info, body, wsgi_environ, ignored_post_data=None, enforce_auth=True):
         """ Performs the authentication against an API key in a specified HTTP header.
         """
-        # Find out if the header was provided at all
-        if sec_def['username'] not in wsgi_environ:
-            if enforce_auth:
-                msg = 'UNAUTHORIZED path_info:`{}`, cid:`{}`'.format(path_info, cid)
-                logger.error(msg + ' (No header)')
-                raise Unauthorized(cid, msg, 'zato-apikey')
-            else:
-                return False
+        # Find out if the header was provided at all, looking it up only once
+        try:
+            given_key = wsgi_environ[sec_def['username']]
+        except KeyError:
+            is_valid = False
+            reason = 'No header'
+        else:
+            expected_key = sec_def.get('password', '')
 
-        expected_key = sec_def.get('password', '')
+            # Passwords are not required
+            is_valid = not expected_key or secrets_match(given_key, expected_key)
+            reason = 'Invalid key'
 
-        # Passwords are not required
-        if expected_key and wsgi_environ[sec_def['username']] != expected_key:
+        if not is_valid:
             if enforce_auth:
-                msg = 'UNAUTHORIZED path_info:`{}`, cid:`{}`'.format(path_info, cid)
-                logger.error(msg + ' (Invalid key)')
+                msg = _unauthorized_template % (path_info, cid)
+                logger.error('%s (%s)', msg, reason)
                 raise Unauthorized(cid, msg, 'zato-apikey')
             else:
                 return False
@@ -279,11 +295,9 @@ class URLData(CyURLData, OAuthDataStore):
 
         if not result:
             if enforce_auth:
-                msg_log = 'Unauthorized; path_info:`{}`, cid:`{}`, sec-wall code:`{}`, description:`{}`\n'.format(
+                logger.error('Unauthorized; path_info:`%s`, cid:`%s`, sec-wall code:`%s`, description:`%s`\n',
                     path_info, cid, result.code, result.description)
-                msg_exc = 'Unauthorized; cid={}'.format(cid)
-                logger.error(msg_log)
-                raise Unauthorized(cid, msg_exc, 'Basic realm="{}"'.format(sec_def.realm))
+                raise Unauthorized(cid, 'Unauthorized; cid={}'.format(cid), 'Basic realm="{}"'.format(sec_def.realm))
             else:
                 return False
 
@@ -297,7 +311,7 @@ class URLData(CyURLData, OAuthDataStore):
         authorization = wsgi_environ.get('HTTP_AUTHORIZATION')
         if not authorization:
             if enforce_auth:
-                msg = 'UNAUTHORIZED path_info:`{}`, cid:`{}`'.format(path_info, cid)
+                msg = _unauthorized_template % (path_info, cid)
                 logger.error(msg)
                 raise Unauthorized(cid, msg, 'JWT')
             else:
@@ -305,7 +319,7 @@ class URLData(CyURLData, OAuthDataStore):
 
         if not authorization.startswith('Bearer '):
             if enforce_auth:
-                msg = 'UNAUTHORIZED path_info:`{}`, cid:`{}`'.format(path_info, cid)
+                msg = _unauthorized_template % (path_info, cid)
                 logger.error(msg)
                 raise Unauthorized(cid, msg, 'JWT')
             else:
@@ -317,7 +331,7 @@ class URLData(CyURLData, OAuthDataStore):
 
         if not result.valid:
             if enforce_auth:
-                msg = 'UNAUTHORIZED path_info:`{}`, cid:`{}`'.format(path_info, cid)
+                msg = _unauthorized_template % (path_info, cid)
                 logger.error(msg)
                 raise Unauthorized(cid, msg, 'JWT')
             else:
@@ -349,8 +363,8 @@ class URLData(CyURLData, OAuthDataStore):
             result = on_wsse_pwd(self._wss, url_config, body, False)
         except Exception:
             if enforce_auth:
-                msg = 'Could not parse the WS-Security data, body:`{}`, e:`{}`'.format(body, format_exc())
-                raise Unauthorized(cid, msg, 'zato-wss')
+                logger.warn('Could not parse the WS-Security data, cid:`%s`, body:`%s`', cid, body, exc_info=True)
+                raise Unauthorized(cid, 'Could not parse the WS-Security data', 'zato-wss')
             else:
                 return False
 
@@ -401,10 +415,9 @@ class URLData(CyURLData, OAuthDataStore):
 
         try:
             self._oauth_server.verify_request(oauth_request)
-        except Exception as e:
+        except Exception:
             if enforce_auth:
-                msg = 'Signature verification failed, wsgi_environ:`%r`, e:`%s`, e.message:`%s`'
-                logger.error(msg, wsgi_environ, format_exc(e), e.message)
+                logger.error('Signature verification failed, wsgi_environ:`%r`', wsgi_environ, exc_info=True)
                 raise Unauthorized(cid, 'Signature verification failed', 'OAuth')
             else:
                 return False
@@ -560,7 +573,7 @@ class URLData(CyURLData, OAuthDataStore):
                     vault_response = self._vault_conn_check_headers(client, wsgi_environ, sec_def_config)
 
         except Exception:
-            logger.warn(format_exc())
+            logger.warn('Could not check Vault credentials, cid:`%s`', cid, exc_info=True)
             if enforce_auth:
                 self._enforce_vault_sec(cid, sec_def.name)
             else:
@@ -598,11 +611,7 @@ class URLData(CyURLData, OAuthDataStore):
 
                     _, sec_type, sec_name = client_def.split(sep)
 
-                    _sec = Bunch()
-                    _sec.is_active = True
-                    _sec.transport = plain_http
-                    _sec.sec_use_rbac = False
-                    _sec.sec_def = self.sec_config_getter[sec_type](sec_name)['config']
+                    _sec = _DelegatedSecInfo(True, plain_http, False, self.sec_config_getter[sec_type](sec_name)['config'])
 
                     auth_result = self.check_security(
                         _sec, cid, channel_item, path_info, payload, wsgi_environ, post_data, worker_store, False)
@@ -614,7 +623,7 @@ class URLData(CyURLData, OAuthDataStore):
                         # in which case we need to overwrite the sec object's sec_def attribute and make it
                         # point to the one that we have just found. Otherwise, it would still point to ZATO_NONE.
                         if hasattr(sec, 'keys'):
-                            sec.sec_def = _sec['sec_def']
+                            sec.sec_def = _sec.sec_def
 
                         self.enrich_with_sec_data(wsgi_environ, _sec.sec_def, sec_type)
                         break
@@ -648,16 +657,15 @@ class URLData(CyURLData, OAuthDataStore):
                 sec, cid, channel_item, path_info, payload, wsgi_environ, post_data, worker_store)
 
         sec_def, sec_def_type = sec.sec_def, sec.sec_def['sec_type']
-        handler_name = '_handle_security_%s' % sec_def_type.replace('-', '_')
 
-        auth_result = getattr(self, handler_name)(cid, sec_def, path_info, payload, wsgi_environ, post_data, enforce_auth)
+        auth_result = self.sec_handler[sec_def_type](cid, sec_def, path_info, payload, wsgi_environ, post_data, enforce_auth)
         if not auth_result:
             return False
 
         # Ok, we now know that the credentials are valid so we can check RBAC permissions if need be.
         if channel_item.get('has_rbac'):
             is_allowed = worker_store.rbac.is_http_client_allowed(
-                'sec_def:::{}:::{}'.format(sec.sec_def['sec_type'], sec.sec_def['name']), wsgi_environ['REQUEST_METHOD'],
+                'sec_def:::{}:::{}'.format(sec_def_type, sec_def['name']), wsgi_environ['REQUEST_METHOD'],
                 channel_item.service_id)
 
             if not is_allowed:
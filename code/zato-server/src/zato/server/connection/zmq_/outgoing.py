@@ -44,6 +44,17 @@ class ZMQFacade(object):
         conn = self.zmq_out_api.connectors[out_name]
         conn.send(msg, *args, **kwargs)
 
+# ################################################################################################################################
+
+    def send_many(self, msgs, out_name):
+        """ Sends multiple messages through the same connection, each as a separate ZeroMQ message.
+        """
+        if self.zmq_out_api == NO_DEFAULT_VALUE:
+            raise ValueError('ZeroMQ connections are disabled - ensure that component_enabled.zeromq in server.conf is True')
+
+        conn = self.zmq_out_api.connectors[out_name]
+        conn.send_many(msgs)
+
 # ################################################################################################################################
 
     def conn(self):
@@ -58,6 +58,9 @@ except ImportError:
 # with sending files in blocks over 2GB.
 BLKSIZE = 0x3FFFFFFF
 
+# Bodies up to that many bytes are sent in the same call as response headers
+COALESCE_MAX_SIZE = 0x10000
+
 HEADER_VALUE_RE = re.compile(r'[\x00-\x1F\x7F]')
 
 log = logging.getLogger(__name__)
@@ -239,18 +242,30 @@ class Response(object):
             headers.append("Transfer-Encoding: chunked\r\n")
         return headers
 
-    def send_headers(self, util_write=util.write, util_to_bytestring=util.to_bytestring):
-        if self.headers_sent:
-            return
+    def get_header_bytes(self, util_to_bytestring=util.to_bytestring):
         tosend = self.default_headers()
         tosend.extend(["%s: %s\r\n" % (k, v) for k, v in self.headers])
 
         header_str = "%s\r\n" % "".join(tosend)
-        util_write(self.sock, util_to_bytestring(header_str, "ascii"))
+        return util_to_bytestring(header_str, "ascii")
+
+    def send_headers(self, util_write=util.write):
+        if self.headers_sent:
+            return
+        util_write(self.sock, self.get_header_bytes())
         self.headers_sent = True
 
-    def write(self, arg, binary_type=binary_type, util_write=util.write):
-        self.send_headers()
+    def write(self, arg, binary_type=binary_type, util_write=util.write, _coalesce_max_size=COALESCE_MAX_SIZE):
+
+        # If headers have not been sent yet, a small non-chunked body is sent along with them
+        # so that the whole response requires a single send call instead of two.
+        if self.headers_sent or self.chunked or not isinstance(arg, binary_type) or len(arg) > _coalesce_max_size:
+            self.send_headers()
+            header_bytes = b''
+        else:
+            header_bytes = self.get_header_bytes()
+            self.headers_sent = True
+
         if not isinstance(arg, binary_type):
             raise TypeError('%r is not a byte' % arg)
         arglen = len(arg)
@@ -258,6 +273,8 @@ class Response(object):
         if self.response_length is not None:
             if self.sent >= self.response_length:
                 # Never write more than self.response_length bytes
+                if header_bytes:
+                    util_write(self.sock, header_bytes)
                 return
 
             tosend = min(self.response_length - self.sent, tosend)
@@ -270,7 +287,7 @@ class Response(object):
             return
 
         self.sent += tosend
-        util_write(self.sock, arg, self.chunked)
+        util_write(self.sock, header_bytes + arg if header_bytes else arg, self.chunked)
 
     def can_sendfile(self):
         return self.cfg.sendfile is not False and sendfile is not None
@@ -48,6 +48,10 @@ Logger._log = logging_Logger_log
 # ConfigObj
 from configobj import ConfigObj
 
+# gevent
+from gevent import config as gevent_config, get_hub
+from gevent._hub_local import get_hub_if_exists
+
 # YAML
 import yaml
 
@@ -126,6 +130,34 @@ class ZatoGunicornApplication(Application):
 
 # ################################################################################################################################
 
+def set_gevent_backend(backend, logger):
+    """ Makes gevent's libev event loop use a specific backend, e.g. linux_iouring, instead of the default one. Must be called
+    before the gevent hub is created. The default backends are still listed after the one requested so that libev can fall back
+    to them if the requested one cannot be initialized at runtime, e.g. because the kernel does not support io_uring.
+    """
+    try:
+        from gevent.libev.corecext import recommended_backends, supported_backends
+    except ImportError:
+        logger.warn('Ignoring gevent_backend `%s`, the libev event loop is not available', backend)
+        return
+
+    if backend not in supported_backends():
+        logger.warn('Ignoring gevent_backend `%s`, supported backends are %s', backend, supported_backends())
+        return
+
+    # Once the hub exists, its event loop has been already created and changing the configuration would have no effect
+    if get_hub_if_exists() is not None:
+        logger.warn('Ignoring gevent_backend `%s`, the gevent hub already exists with backend `%s`',
+            backend, get_hub_if_exists().loop.backend)
+        return
+
+    gevent_config.libev_backend = ','.join([backend] + recommended_backends())
+
+    # Creating the hub here confirms which backend libev actually ended up using
+    logger.info('Using gevent backend `%s` (requested `%s`)', get_hub().loop.backend, backend)
+
+# ################################################################################################################################
+
 def run(base_dir, start_gunicorn_app=True, options=None):
     # type: (str, bool, dict)
     options = options or {}
@@ -166,6 +198,13 @@ def run(base_dir, start_gunicorn_app=True, options=None):
     logger = logging.getLogger(__name__)
     kvdb_logger = logging.getLogger('zato_kvdb')
 
+    # New in 3.2 hence optional - an alternative libev backend for the event loop, e.g. linux_iouring.
+    # It needs to be set before anything, including reading from stdin below, creates the gevent hub,
+    # which is why it is read directly from server.conf, without waiting for the full configuration to be loaded.
+    gevent_backend = ConfigObj(os.path.join(repo_location, 'server.conf'), use_zato=False).get('misc', {}).get('gevent_backend')
+    if gevent_backend:
+        set_gevent_backend(gevent_backend, logger)
+
     crypto_manager = ServerCryptoManager(repo_location, secret_key=options['secret_key'], stdin_data=read_stdin_data())
     secrets_config = ConfigObj(os.path.join(repo_location, 'secrets.conf'), use_zato=False)
     server_config = get_config(repo_location, 'server.conf', crypto_manager=crypto_manager, secrets_conf=secrets_config)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright (C) Zato Source s.r.o. https://zato.io
+
+Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+# stdlib
+from unittest import main, TestCase
+
+# Zato
+from zato.server.base.parallel.http import HTTPHandler
+
+# ################################################################################################################################
+# ################################################################################################################################
+
+class ContentLengthTestCase(TestCase):
+
+    def invoke(self, method, status, payload, service_headers=None):
+        """ Runs a request through HTTPHandler, with a dispatcher that sets the status and headers the way services do,
+        and returns the headers the response was started with.
+        """
+        def dispatch(cid, request_ts_utc, wsgi_environ, worker_store):
+            wsgi_environ['zato.http.response.status'] = status
+            wsgi_environ['zato.http.response.headers'].update(service_headers or {})
+            return payload
+
+        handler = HTTPHandler()
+        handler.client_address_headers = ()
+        handler.request_dispatcher_dispatch = dispatch
+        handler.worker_store = None
+        handler.needs_access_log = False
+
+        started = {}
+
+        def start_response(status, headers):
+            started['status'] = status
+            started['headers'] = list(headers)
+
+        wsgi_environ = {'REQUEST_METHOD': method}
+        handler.on_wsgi_request(wsgi_environ, start_response, cid='abc')
+
+        return started['headers']
+
+    def get_content_length(self, headers):
+        return [value for name, value in headers if name.lower() == 'content-length']
+
+    def test_content_length_from_payload(self):
+        headers = self.invoke('GET', '200 OK', 'zażółć', {'content-length': '1'})
+        self.assertListEqual(self.get_content_length(headers), [str(len('zażółć'.encode('utf8')))])
+
+    def test_content_length_no_body(self):
+        for status in ('101 Switching Protocols', '204 No Content', '304 Not Modified'):
+            headers = self.invoke('GET', status, b'', {'Content-Length': '123'})
+            self.assertListEqual(self.get_content_length(headers), [], status)
+
+    def test_content_length_head(self):
+
+        # A length set by the service is kept ..
+        headers = self.invoke('HEAD', '200 OK', b'', {'Content-Length': '123'})
+        self.assertListEqual(self.get_content_length(headers), ['123'])
+
+        # .. and none is added if the service did not set it.
+        headers = self.invoke('HEAD', '200 OK', b'')
+        self.assertListEqual(self.get_content_length(headers), [])
+
+# ################################################################################################################################
+# ################################################################################################################################
+
+if __name__ == '__main__':
+    main()
+
+# ################################################################################################################################
+# ################################################################################################################################
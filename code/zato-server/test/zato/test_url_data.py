@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright (C) Zato Source s.r.o. https://zato.io
+
+Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+# stdlib
+from unittest import main, TestCase
+
+# Bunch
+from bunch import Bunch
+
+# Zato
+from zato.common.api import SEC_DEF_TYPE, ZATO_NONE
+from zato.server.connection.http_soap.url_data import URLData
+
+# ################################################################################################################################
+# ################################################################################################################################
+
+class RBACDelegatedSecurityTestCase(TestCase):
+
+    def get_url_data(self, sec_def):
+
+        # The full initializer needs a whole worker store, only the parts used by security checks are set here
+        url_data = URLData.__new__(URLData)
+        url_data.sec_config_getter = {SEC_DEF_TYPE.BASIC_AUTH: lambda name: {'config': sec_def}}
+        url_data.sec_handler = {SEC_DEF_TYPE.BASIC_AUTH: lambda *ignored_args: True}
+
+        return url_data
+
+    def get_worker_store(self, role_id, perm_id, service_id, sec_name):
+        rbac = Bunch()
+        rbac.http_permissions = {'GET': perm_id}
+        rbac.registry = Bunch(_allowed={(role_id, perm_id, service_id): True})
+        rbac.role_id_to_client_def = {role_id: ['sec_def:::{}:::{}'.format(SEC_DEF_TYPE.BASIC_AUTH, sec_name)]}
+
+        return Bunch(rbac=rbac)
+
+    def test_check_rbac_delegated_security_ok(self):
+
+        role_id = 1
+        perm_id = 2
+        service_id = 3
+        sec_name = 'my.sec.def'
+
+        sec_def = Bunch(id=4, name=sec_name, username='my.username', sec_type=SEC_DEF_TYPE.BASIC_AUTH)
+
+        url_data = self.get_url_data(sec_def)
+        worker_store = self.get_worker_store(role_id, perm_id, service_id, sec_name)
+
+        sec = Bunch(sec_def=ZATO_NONE, sec_use_rbac=True)
+        channel_item = {'service_id': service_id}
+        wsgi_environ = {'REQUEST_METHOD': 'GET'}
+
+        result = url_data.check_security(sec, 'abc', channel_item, '/my/path', '', wsgi_environ, None, worker_store)
+
+        self.assertTrue(result)
+
+        # The RBAC definition now points to the underlying one that the client was authenticated with
+        self.assertIs(sec.sec_def, sec_def)
+
+        self.assertEqual(wsgi_environ['zato.sec_def']['id'], sec_def.id)
+        self.assertEqual(wsgi_environ['zato.sec_def']['name'], sec_name)
+        self.assertEqual(wsgi_environ['zato.sec_def']['type'], SEC_DEF_TYPE.BASIC_AUTH)
+
+# ################################################################################################################################
+# ################################################################################################################################
+
+if __name__ == '__main__':
+    main()
+
+# ################################################################################################################################
+# ################################################################################################################################
@@ -10,7 +10,6 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 import logging
-from copy import deepcopy
 from csv import DictWriter
 from datetime import datetime
 from io import StringIO
@@ -557,7 +556,7 @@ def settings(req):
         }
 
         _settings = {}
-        defaults = deepcopy(DEFAULT_STATS_SETTINGS)
+        defaults = dict(DEFAULT_STATS_SETTINGS) # All the values are integers so a shallow copy suffices
 
         for mapping in job_mappings:
 
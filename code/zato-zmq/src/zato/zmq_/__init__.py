@@ -8,13 +8,13 @@ Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
 
 # stdlib
 from logging import getLogger
-from traceback import format_exc
 
 # PyZMQ
 import zmq.green as zmq
 
 # Zato
 from zato.common.api import ZMQ
+from zato.common.ipc import get_context
 from zato.server.connection.connector import Connector
 
 # ################################################################################################################################
@@ -26,6 +26,9 @@ logger = getLogger(__name__)
 class Base(Connector):
     """ Base class for ZeroMQ connections, both channels and outgoing ones, other than Majordomo (MDP).
     """
+    # Kernel-level send buffer size to set, if any
+    socket_sndbuf = None
+
     def init_simple_socket(self):
         """ Initializes a ZeroMQ socket other than Majordomo one.
         """
@@ -33,8 +36,17 @@ class Base(Connector):
             # Open a ZMQ socket and set its options, if required
             self.impl = self.ctx.socket(getattr(zmq, self.config.socket_type))
 
+            # Make sure that both memory use and the time it takes to close the socket are bounded
+            self.impl.setsockopt(zmq.SNDHWM, ZMQ.DEFAULT.SNDHWM)
+            self.impl.setsockopt(zmq.RCVHWM, ZMQ.DEFAULT.RCVHWM)
+            self.impl.setsockopt(zmq.LINGER, ZMQ.DEFAULT.LINGER)
+
+            if self.socket_sndbuf:
+                self.impl.setsockopt(zmq.SNDBUF, self.socket_sndbuf)
+
             if self.config.socket_type == ZMQ.SUB and self.config.sub_key:
-                self.impl.setsockopt(zmq.SUBSCRIBE, self.config.sub_key)
+                sub_key = self.config.sub_key
+                self.impl.setsockopt(zmq.SUBSCRIBE, sub_key if isinstance(sub_key, bytes) else sub_key.encode('utf8'))
 
             # Whether to bind or connect?
             socket_method = getattr(self.impl, self.config.socket_method)
@@ -44,18 +56,20 @@ class Base(Connector):
             self.is_connected = True
 
         except Exception:
-            logger.warn('ZeroMQ socket could not be initialized, e:`%s`', format_exc())
+            logger.warn('ZeroMQ socket could not be initialized', exc_info=True)
             raise
 
     def _start(self):
         self.conn = self
-        self.ctx = zmq.Context()
+
+        # Connections never create contexts of their own, they use the one shared with IPC endpoints in the same process
+        self.ctx = get_context()
 
     def _send(self, msg, *args, **kwargs):
         raise NotImplementedError('Should be defined in subclasses')
 
     def _stop(self):
-        self.impl.close(50) # TODO: Should be configurable
+        self.impl.close(ZMQ.DEFAULT.LINGER)
 
     def _get_log_details(self, address):
         return '{} {}'.format(self.config.socket_type, address)
@@ -9,11 +9,15 @@ Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 # stdlib
+from errno import ENOTSOCK
 from logging import getLogger
 
 # gevent
 from gevent import spawn
 
+# PyZMQ
+import zmq.green as zmq
+
 # Zato
 from zato.common.api import CHANNEL
 from zato.common.util.api import new_cid
@@ -43,21 +47,53 @@ class Simple(Base):
         _impl_recv = self.impl.recv
         _config = self.config
         _channel_zmq = CHANNEL.ZMQ
+        _zmq_again = zmq.Again
+        _zmq_noblock = zmq.NOBLOCK
 
-        # Run the main loop
-        while self.keep_running:
+        def _handle(payload):
 
             # Spawn a new greenlet for the callback invoking a service with data received from the socket on input
             _spawn(_callback, {
                 'cid': _new_cid(),
                 'service': _service,
-                'payload': _impl_recv(), # This line is blocking waiting for requests
+                'payload': payload,
                 'zato_ctx': {'channel_config': _config}
             }, _channel_zmq, None)
 
+        # Run the main loop
+        try:
+            while self.keep_running:
+
+                # This line is blocking waiting for requests ..
+                _handle(_impl_recv())
+
+                # .. and once we are woken up, we drain everything that is already queued up
+                # before going back to sleep, which means one wake-up per burst rather than per message.
+                while True:
+                    try:
+                        _handle(_impl_recv(_zmq_noblock))
+                    except _zmq_again:
+                        break
+
+        except zmq.ZMQError as e:
+
+            # The socket was closed by self._stop in another greenlet, in which case we simply return
+            if e.errno == ENOTSOCK and not self.keep_running:
+                logger.debug('Stopping ZeroMQ channel `%s` (ENOTSOCK)', self.name)
+            else:
+                raise
+
     def _send(self, msg, *args, **kwargs):
         self.impl.send(msg, *args, **kwargs)
 
+    def _stop(self):
+
+        # Signal to the main loop that it should not report a closed socket as an error ..
+        self.keep_running = False
+
+        # .. and close the socket, which will wake up the loop if it is blocked in recv.
+        self.impl.close(0)
+
 # ################################################################################################################################
 
 class MDPv01(Base):
@@ -10,6 +10,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 # stdlib
 import logging
+from collections import deque
 
 # ZeroMQ
 import zmq.green as zmq
@@ -90,7 +91,7 @@ class Service(object):
     """
     def __init__(self, name=None, workers=None):
         self.name = name
-        self.workers = workers or []
+        self.workers = deque(workers or ())
 
         # How many workers, busy or not, this service has
         self.len_current_workers = 0
@@ -101,8 +102,9 @@ class Service(object):
         # Will be set to True if we cannot add more workers to that service
         self.has_max_workers = False
 
-        # All requests currently queued up, i.e. received from clients but not delivered to workers yet
-        self.pending_requests = []
+        # All requests currently queued up, i.e. received from clients but not delivered to workers yet,
+        # kept in a deque so that taking the oldest one is O(1) rather than a list shift.
+        self.pending_requests = deque()
 
 # ################################################################################################################################
 
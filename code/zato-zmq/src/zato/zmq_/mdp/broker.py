@@ -28,6 +28,7 @@ from past.builtins import basestring
 
 # Zato
 from zato.common.api import CHANNEL, ZMQ
+from zato.common.ipc import get_context
 from zato.common.util.api import new_cid, wait_until_port_free
 from zato.zmq_.mdp import const, EventBrokerDisconnect, EventBrokerHeartbeat, EventClientReply, EventWorkerRequest, \
      Service, WorkerData
@@ -83,7 +84,7 @@ class Broker(object):
         # How often, in seconds, to send a heartbeat to workers
         self.heartbeat = config.heartbeat
 
-        self.ctx = zmq.Context()
+        self.ctx = get_context()
         self.socket = self.ctx.socket(zmq.ROUTER)
         self.socket.linger = config.linger
         self.poller = zmq.Poller()
@@ -150,7 +151,7 @@ class Broker(object):
                 break
 
             except Exception:
-                logger.warn(format_exc())
+                logger.warn('Error in ZMQ MDP 0.1 broker at %s', self.address, exc_info=True)
 
 # ################################################################################################################################
 
@@ -229,7 +230,7 @@ class Broker(object):
             func(sender_id, *payload)
 
         except Exception:
-            logger.warn(format_exc())
+            logger.warn('Could not handle message at %s', self.address, exc_info=True)
 
 # ################################################################################################################################
 
@@ -291,9 +292,12 @@ class Broker(object):
 
             self.add_workers(service)
 
-        while service.pending_requests and service.workers:
-            req = service.pending_requests.pop(0)
-            worker = self.workers.pop(service.workers.pop(0))
+        pending_requests = service.pending_requests
+        service_workers = service.workers
+
+        while pending_requests and service_workers:
+            req = pending_requests.popleft()
+            worker = self.workers.pop(service_workers.popleft())
 
             if worker.type == const.worker_type.zato:
                 self.send_to_worker_zato(req, worker, service_name)
@@ -9,6 +9,7 @@ Licensed under LGPLv3, see LICENSE.txt for terms and conditions.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 # Zato
+from zato.common.api import ZMQ
 from zato.zmq_ import Base
 
 # ################################################################################################################################
@@ -16,6 +17,8 @@ from zato.zmq_ import Base
 class Simple(Base):
     """ An outgoing ZeroMQ connection of a type other than Majordomo (MDP).
     """
+    socket_sndbuf = ZMQ.DEFAULT.SNDBUF
+
     def _start(self):
         super(Simple, self)._start()
         self.init_simple_socket()
@@ -23,4 +26,12 @@ class Simple(Base):
     def send(self, msg):
         self.impl.send_string(msg)
 
+    def send_many(self, msgs):
+        """ Sends each of the input messages, in order, as a separate ZeroMQ message. Meant for callers that produce
+        messages in bursts - ZeroMQ will batch them on the wire by itself as long as they are enqueued one after another.
+        """
+        _send_string = self.impl.send_string
+        for msg in msgs:
+            _send_string(msg)
+
 # ################################################################################################################################
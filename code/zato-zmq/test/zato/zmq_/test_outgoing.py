@@ -117,4 +117,19 @@ class TestOutgoingZMQ(TestCase):
         outgoing, client = self._get_outgoing_and_client(get_free_tcp_port(), ZMQ.PUB, 'connect', expected)
         self._compare_data(outgoing, client, expected)
 
+# ################################################################################################################################
+
+    def test_send_many(self):
+        expected = ['send-many-{}-{}'.format(idx, rand_string()) for idx in range(3)]
+        outgoing, client = self._get_outgoing_and_client(get_free_tcp_port(), ZMQ.PUSH, 'bind', None)
+
+        spawn(outgoing.start)
+        sleep(0.1)
+
+        outgoing.send_many(expected)
+        sleep(0.1)
+
+        received = [client.socket.recv_string(zmq.NOBLOCK) for _item in expected]
+        self.assertListEqual(expected, received)
+
 # ################################################################################################################################